@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence
 import difflib
 
+import numpy as np
 import pandas as pd
 from bc3_lib import parse_bc3_to_df
 
@@ -19,6 +20,11 @@ class DiffService:
     def load_dfs(old_path: Path, new_path: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
         return parse_bc3_to_df(old_path), parse_bc3_to_df(new_path)
 
+    @staticmethod
+    def load_many(paths: Sequence[Path]) -> List[pd.DataFrame]:
+        """Carga N BC3 (en orden cronológico) para la comparación N-vías."""
+        return [parse_bc3_to_df(p) for p in paths]
+
     # ───────────────────── helpers de jerarquía ─────────────────────────
     @staticmethod
     def _build_parent_map(df: pd.DataFrame) -> Dict[str, str]:
@@ -111,6 +117,118 @@ class DiffService:
         p_old, p_new = DiffService._build_parent_map(df_old), DiffService._build_parent_map(df_new)
         return DiffService._column_diff(df_old, df_new, "importe_pres", p_old, p_new)
 
+    # ──────────────────── comparación N-vías ────────────────────────────
+    @staticmethod
+    def _parent_series(df: pd.DataFrame) -> pd.Series:
+        """Versión vectorizada de `_build_parent_map`: Serie {hijo: padre}."""
+        if "hijos" not in df.columns:
+            return pd.Series(dtype=object)
+        links = (
+            df[["codigo", "hijos"]]
+            .assign(hijo=df["hijos"].fillna("").astype(str).str.split(","))
+            .explode("hijo")
+        )
+        links["hijo"] = links["hijo"].str.strip()
+        links = links[links["hijo"].fillna("") != ""]
+        links = links.drop_duplicates("hijo", keep="first")   # primer padre gana
+        return pd.Series(links["codigo"].to_numpy(), index=links["hijo"].to_numpy())
+
+    @staticmethod
+    def _ancestor_series(parent: pd.Series, codes: pd.Index) -> pd.Series:
+        """
+        `_ancestor_chain` para todos los *codes* a la vez: sube un nivel de
+        jerarquía por iteración (coste ∝ profundidad, no ∝ nº de códigos).
+        """
+        chain = pd.Series("", index=codes, dtype=object)
+        cur = pd.Series(parent.reindex(codes).to_numpy(), index=codes)
+        for _ in range(len(parent) + 1):          # tope ante ciclos
+            alive = cur.notna()
+            if not alive.any():
+                break
+            sep = chain[alive].where(chain[alive] == "", " > " + chain[alive])
+            chain[alive] = cur[alive] + sep
+            cur = pd.Series(parent.reindex(cur.to_numpy()).to_numpy(), index=codes)
+        return chain
+
+    @staticmethod
+    def history_diffs(
+        dfs: Sequence[pd.DataFrame],
+        columns: Sequence[str] = ("precio", "cantidad_pres", "importe_pres"),
+        labels: Optional[Sequence[str]] = None,
+        only_changed: bool = True,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Comparación de N versiones (base, revisiones…) en una sola pasada.
+
+        Construye UNA vez el índice combinado de códigos y la jerarquía de
+        cada versión, y devuelve por cada columna de *columns* una tabla
+        ancha:
+            codigo · ancestors_<version>… · descripcion_corta · <col>_<version>…
+            · primera_version_cambio · n_cambios
+
+        Un código cambia entre dos versiones consecutivas si su valor difiere
+        o si aparece/desaparece. Con *only_changed* se omiten los códigos
+        sin ningún cambio.
+        """
+        if len(dfs) < 2:
+            raise ValueError("Se necesitan al menos dos versiones para comparar")
+        labels = list(labels) if labels is not None else [f"v{i}" for i in range(1, len(dfs) + 1)]
+        if len(labels) != len(dfs) or len(set(labels)) != len(labels):
+            raise ValueError("Debe haber una etiqueta única por versión")
+
+        # 1) índice combinado + DataFrames alineados ------------------------
+        frames = [df.drop_duplicates("codigo").set_index("codigo") for df in dfs]
+        codes = frames[0].index
+        for f in frames[1:]:
+            codes = codes.union(f.index, sort=False)
+        aligned = [f.reindex(codes) for f in frames]
+        present = pd.DataFrame(
+            {lab: codes.isin(f.index) for lab, f in zip(labels, frames)}, index=codes
+        )
+
+        # 2) jerarquía por versión + descripción de la última donde existe --
+        ancestors = pd.DataFrame(
+            {
+                f"ancestors_{lab}": DiffService._ancestor_series(
+                    DiffService._parent_series(df), codes
+                ).where(present[lab], "")
+                for lab, df in zip(labels, dfs)
+            },
+            index=codes,
+        )
+        pres = present.to_numpy()
+        last = pres.shape[1] - 1 - pres[:, ::-1].argmax(axis=1)
+        desc = np.column_stack([a["descripcion_corta"].to_numpy(dtype=object) for a in aligned])
+        last_desc = np.take_along_axis(desc, last[:, None], axis=1)[:, 0]
+
+        # 3) histórico por columna ------------------------------------------
+        out: Dict[str, pd.DataFrame] = {}
+        for col in columns:
+            values = pd.DataFrame({lab: a[col] for lab, a in zip(labels, aligned)}, index=codes)
+            prev, curr = values.iloc[:, :-1].to_numpy(), values.iloc[:, 1:].to_numpy()
+            p_prev, p_curr = present.iloc[:, :-1].to_numpy(), present.iloc[:, 1:].to_numpy()
+            same = (prev == curr) | (pd.isna(prev) & pd.isna(curr))
+            changed = (p_prev != p_curr) | (p_prev & p_curr & ~same)
+
+            n_changes = changed.sum(axis=1)
+            first = pd.Series(changed.argmax(axis=1) + 1).map(dict(enumerate(labels)))
+            first = first.where(n_changes > 0, "").to_numpy()
+
+            table = pd.DataFrame(
+                {
+                    "codigo": codes,
+                    **{c: ancestors[c].to_numpy() for c in ancestors.columns},
+                    "descripcion_corta": last_desc,
+                    **{f"{col}_{lab}": values[lab].to_numpy() for lab in labels},
+                    "primera_version_cambio": first,
+                    "n_cambios": n_changes,
+                }
+            )
+            if only_changed:
+                table = table[n_changes > 0].reset_index(drop=True)
+            out[col] = table
+        return out
+
     # ──────────────────── nuevos y eliminados ───────────────────────────
     @staticmethod
     def new_deleted_diffs(df_old: pd.DataFrame, df_new: pd.DataFrame) -> pd.DataFrame:
@@ -24,6 +24,13 @@ QTY_DIFF_XLSX_DEFAULT: Path         = Path("output/comparativo_medicion.xlsx")
 IMP_DIFF_XLSX_DEFAULT: Path         = Path("output/comparativo_importe.xlsx")
 NEW_DEL_DIFF_XLSX_DEFAULT: Path     = Path("output/nuevas_viejas_lineas.xlsx")
 
+# comparación N-vías (histórico por código)
+HISTORY_XLSX_DEFAULTS: dict[str, Path] = {
+    "precio":        Path("output/historico_precio.xlsx"),
+    "cantidad_pres": Path("output/historico_medicion.xlsx"),
+    "importe_pres":  Path("output/historico_importe.xlsx"),
+}
+
 # CSV
 CSV_SEP: str = ";"
 CSV_ENCODING: str = "utf-8"
@@ -1,5 +1,6 @@
 # interface_adapters/controllers/compare_controller.py
 from pathlib import Path
+from typing import Sequence
 
 from application.services.diff_service import DiffService
 from infrastructure.exporters.df_exporter import export_df
@@ -49,3 +50,34 @@ def run(old_bc3: Path, new_bc3: Path) -> None:
     print(f"Nuevas/Viejas líneas → {settings.NEW_DEL_DIFF_XLSX_DEFAULT.resolve()}")
 
     print("\nTodos los informes XLSX se han generado en la carpeta 'output/'.")
+
+
+def _version_labels(bc3_paths: Sequence[Path]) -> list[str]:
+    """
+    Etiqueta única por versión: el nombre del fichero; si se repite
+    (p. ej. '2026-01/presupuesto.bc3', '2026-02/presupuesto.bc3') se
+    antepone la carpeta y, como último recurso, la posición.
+    """
+    stems = [p.stem for p in bc3_paths]
+    if len(set(stems)) == len(stems):
+        return stems
+    labels = [f"{p.parent.name}_{p.stem}" for p in bc3_paths]
+    if len(set(labels)) == len(labels):
+        return labels
+    return [f"{i}_{p.stem}" for i, p in enumerate(bc3_paths, start=1)]
+
+
+def run_multi(bc3_paths: Sequence[Path]) -> None:
+    """Comparación N-vías: base + revisiones, en orden cronológico."""
+    dfs = DiffService.load_many(bc3_paths)
+    labels = _version_labels(bc3_paths)
+
+    histories = DiffService.history_diffs(
+        dfs, columns=list(settings.HISTORY_XLSX_DEFAULTS), labels=labels
+    )
+    for col, hist in histories.items():
+        path = settings.HISTORY_XLSX_DEFAULTS[col]
+        export_df_excel(hist, path)
+        print(f"Histórico {col} → {path.resolve()}")
+
+    print("\nTodos los históricos XLSX se han generado en la carpeta 'output/'.")
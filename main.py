@@ -5,34 +5,57 @@ import sys
 
 from config import settings
 from interface_adapters.controllers.compare_controller import run as run_compare
+from interface_adapters.controllers.compare_controller import run_multi as run_compare_multi
 
 
 def _parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
         prog="compare-bc3",
-        description="Compara dos presupuestos BC3, imprime sus DataFrames, guarda CSV y detecta cambios en 'descripcion_larga'",
+        description=(
+            "Compara dos presupuestos BC3 (o, con --multi, una base y sus revisiones) "
+            "y genera informes XLSX de cambios"
+        ),
     )
     p.add_argument(
         "old",
         nargs="?",
-        default=settings.OLD_BC3_DEFAULT,
+        default=None,
         type=Path,
-        help="BC3 original",
+        help=f"BC3 original (por defecto {settings.OLD_BC3_DEFAULT})",
     )
     p.add_argument(
         "new",
         nargs="?",
-        default=settings.NEW_BC3_DEFAULT,
+        default=None,
         type=Path,
-        help="BC3 revisado",
+        help=f"BC3 revisado (por defecto {settings.NEW_BC3_DEFAULT})",
     )
-    return p.parse_args()
+    p.add_argument(
+        "--multi",
+        nargs="+",
+        type=Path,
+        metavar="BC3",
+        help="Comparación N-vías: BC3 base seguido de sus revisiones (en orden)",
+    )
+    args = p.parse_args()
+    if args.multi and (args.old is not None or args.new is not None):
+        p.error("--multi no admite los argumentos posicionales 'old'/'new'")
+    if args.multi and len(args.multi) < 2:
+        p.error("--multi necesita al menos dos BC3")
+    if args.old is None:
+        args.old = settings.OLD_BC3_DEFAULT
+    if args.new is None:
+        args.new = settings.NEW_BC3_DEFAULT
+    return args
 
 
 def main() -> None:
     args = _parse_args()
     try:
-        run_compare(args.old, args.new)
+        if args.multi:
+            run_compare_multi(args.multi)
+        else:
+            run_compare(args.old, args.new)
     except FileNotFoundError as exc:
         print(f"[ERROR] No se encontró el fichero: {exc.filename}", file=sys.stderr)
         sys.exit(2)